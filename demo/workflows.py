@@ -19,12 +19,24 @@ async def greet(name: str) -> str:
     return f"Hello, {name}!"
 
 
-@dataclass
+@dataclass(frozen=True)
 class OrderItem:
+    # Explicit __slots__ rather than dataclass(slots=True), which needs 3.10+
+    __slots__ = ("product", "quantity", "price")
+
     product: str
     quantity: int
     price: float
 
+    # Frozen slotted instances have no __dict__ and reject setattr, so copy
+    # and pickle need explicit state handling (as dataclass(slots=True) adds)
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
 @activity.defn
 async def validate_order(item: OrderItem) -> bool:
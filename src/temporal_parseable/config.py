@@ -3,19 +3,40 @@
 from __future__ import annotations
 
 import base64
-from typing import Dict
+import functools
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings
 
+# Parseable requires specific X-P-Log-Source values per signal type
+_LOG_SOURCE_MAP: Dict[str, str] = {
+    "traces": "otel-traces",
+    "logs": "otel-logs",
+    "metrics": "otel-metrics",
+}
+
+# cached_property values derived from the fields; see ParseableConfig.model_copy
+_CACHED_PROPERTIES = (
+    "auth_header",
+    "traces_endpoint",
+    "logs_endpoint",
+    "metrics_endpoint",
+)
+
 
 class ParseableConfig(BaseSettings):
     """Configuration for connecting to Parseable and Temporal.
 
     All fields can be overridden via environment variables with the
     ``PARSEABLE_`` prefix. For example, ``PARSEABLE_URL`` sets ``url``.
+
+    Instances are frozen, since the auth header, signal headers and
+    endpoints are derived once from the fields and cached.
     """
 
-    model_config = {"env_prefix": "PARSEABLE_"}
+    model_config = {"env_prefix": "PARSEABLE_", "frozen": True}
 
     # Parseable connection
     url: str = "http://localhost:8000"
@@ -39,7 +60,40 @@ class ParseableConfig(BaseSettings):
     enable_logs: bool = True
     enable_metrics: bool = True
 
-    @property
+    # Gzip-compress export bodies; disable for servers without gzip support
+    enable_gzip: bool = True
+
+    # Headers for each signal's configured stream, keyed by signal. Plain
+    # dicts, not mappingproxy, so the config stays picklable and
+    # deep-copyable; headers_for_signal hands out read-only views.
+    _headers: Dict[str, Dict[str, str]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute the headers for each signal's configured stream."""
+        super().model_post_init(__context)
+        self._headers = {
+            "traces": self._build_headers(self.traces_stream, "traces"),
+            "logs": self._build_headers(self.logs_stream, "logs"),
+            "metrics": self._build_headers(self.metrics_stream, "metrics"),
+        }
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> ParseableConfig:
+        """Copy the config, recomputing derived values if fields are updated.
+
+        Pydantic copies cached properties and private attributes verbatim,
+        so without this an updated copy would keep the original's auth
+        header, signal headers and endpoints.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in _CACHED_PROPERTIES:
+                copied.__dict__.pop(name, None)
+            copied.model_post_init(None)
+        return copied
+
+    @functools.cached_property
     def auth_header(self) -> str:
         """Return the Basic-auth header value expected by Parseable."""
         token = base64.b64encode(
@@ -47,34 +101,47 @@ class ParseableConfig(BaseSettings):
         ).decode()
         return f"Basic {token}"
 
-    # Parseable requires specific X-P-Log-Source values per signal type
-    _LOG_SOURCE_MAP: Dict[str, str] = {
-        "traces": "otel-traces",
-        "logs": "otel-logs",
-        "metrics": "otel-metrics",
-    }
+    def headers_for_signal(self, stream: str, signal: str) -> Mapping[str, str]:
+        """Return the HTTP headers Parseable requires for a given signal.
 
-    def headers_for_signal(self, stream: str, signal: str) -> Dict[str, str]:
-        """Build the HTTP headers Parseable requires for a given signal.
+        Headers for a signal's configured stream are precomputed; other
+        streams get freshly built headers. Either way the result is a
+        read-only view; copy with ``dict(...)`` if mutation is needed.
 
         Args:
             stream: The Parseable stream name (e.g. "temporal-traces").
             signal: The signal type — one of "traces", "logs", "metrics".
+
+        Raises:
+            ValueError: If ``signal`` is not a known signal type.
         """
+        headers = self._headers.get(signal)
+        if headers is None or headers["X-P-Stream"] != stream:
+            headers = self._build_headers(stream, signal)
+        return MappingProxyType(headers)
+
+    def _build_headers(self, stream: str, signal: str) -> Dict[str, str]:
+        try:
+            log_source = _LOG_SOURCE_MAP[signal]
+        except KeyError:
+            raise ValueError(
+                f"Unknown signal {signal!r}; expected one of "
+                f"{', '.join(_LOG_SOURCE_MAP)}"
+            ) from None
         return {
             "Authorization": self.auth_header,
             "X-P-Stream": stream,
-            "X-P-Log-Source": self._LOG_SOURCE_MAP.get(signal, f"otel-{signal}"),
+            "X-P-Log-Source": log_source,
         }
 
-    @property
+    @functools.cached_property
     def traces_endpoint(self) -> str:
         return f"{self.url}/v1/traces"
 
-    @property
+    @functools.cached_property
     def logs_endpoint(self) -> str:
         return f"{self.url}/v1/logs"
 
-    @property
+    @functools.cached_property
     def metrics_endpoint(self) -> str:
         return f"{self.url}/v1/metrics"
@@ -3,6 +3,8 @@
 Parseable's OTLP endpoints require JSON encoding (not protobuf).
 We create custom exporters that use a requests Session with a
 middleware adapter to convert protobuf payloads to OTLP JSON before sending.
+One adapter, and therefore one connection pool, is shared by all signals
+targeting the same Parseable server.
 
 The OTLP JSON spec requires bytes fields (trace_id, span_id, etc.) to be
 lowercase hex strings, but protobuf's ``MessageToDict`` outputs base64.
@@ -11,53 +13,84 @@ We post-process the dict to fix this before serialising to JSON.
 
 from __future__ import annotations
 
-import base64
-import json
-from typing import Any
+import binascii
+import gzip
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+from urllib.parse import urlsplit
 
+import orjson
 import requests
-from google.protobuf.json_format import MessageToDict
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
-from opentelemetry.exporter.otlp.proto.http._log_exporter import OTLPLogExporter
-from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
-    ExportTraceServiceRequest,
-)
-from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import (
-    ExportLogsServiceRequest,
-)
-from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import (
-    ExportMetricsServiceRequest,
-)
+from urllib3.util.retry import Retry
 
 from .config import ParseableConfig
 
+# The OTLP exporters and protobuf modules are imported inside the factories
+# below so that workers only pay for the signals they enable.
+if TYPE_CHECKING:
+    from opentelemetry.exporter.otlp.proto.http._log_exporter import (
+        OTLPLogExporter,
+    )
+    from opentelemetry.exporter.otlp.proto.http.metric_exporter import (
+        OTLPMetricExporter,
+    )
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+        OTLPSpanExporter,
+    )
+
 # Keys whose values are base64-encoded bytes that must become hex strings
 # per the OTLP JSON specification.
 _BYTES_KEYS = frozenset({
     "traceId", "spanId", "parentSpanId",
 })
 
+# Bodies smaller than this are sent uncompressed; gzip gains little on them.
+_GZIP_MIN_SIZE = 1024
+
+# Connection pool size per adapter; the batch processors of all three
+# signals may export concurrently through the shared pool.
+_POOL_SIZE = 50
+
+# Retry connection failures at the transport level. HTTP status retries are
+# left to the OTLP exporter, which already backs off on 5xx responses.
+_CONNECT_RETRY = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.2)
+
 
 def _b64_to_hex(value: str) -> str:
-    """Convert a base64-encoded string to a lowercase hex string."""
-    try:
-        raw = base64.b64decode(value)
-        return raw.hex()
-    except Exception:
-        return value
+    """Convert a base64-encoded string to a lowercase hex string.
+
+    ``MessageToDict`` always emits valid base64 for bytes fields, so a
+    ``binascii.Error`` here indicates a malformed payload and is not swallowed.
+    """
+    return binascii.a2b_base64(value).hex()
 
 
 def _fix_bytes_fields(obj: Any) -> Any:
-    """Recursively convert base64 bytes fields to hex strings in a dict."""
-    if isinstance(obj, dict):
-        return {
-            k: _b64_to_hex(v) if k in _BYTES_KEYS and isinstance(v, str)
-            else _fix_bytes_fields(v)
-            for k, v in obj.items()
-        }
-    if isinstance(obj, list):
-        return [_fix_bytes_fields(item) for item in obj]
+    """Convert base64 bytes fields to hex strings in a dict, in place.
+
+    Walks the tree iteratively to avoid per-node call overhead. The input is
+    mutated, which is safe for the fresh dicts returned by ``MessageToDict``.
+    Containers are matched by exact type, as ``MessageToDict`` only produces
+    plain ``dict``/``list``/``str`` values; subclasses such as ``OrderedDict``
+    are not traversed.
+    """
+    stack = deque([obj])
+    while stack:
+        node = stack.pop()
+        if type(node) is dict:
+            for k, v in node.items():
+                t = type(v)
+                if t is str:
+                    if k in _BYTES_KEYS:
+                        node[k] = _b64_to_hex(v)
+                elif t is dict or t is list:
+                    stack.append(v)
+        elif type(node) is list:
+            for item in node:
+                t = type(item)
+                if t is dict or t is list:
+                    stack.append(item)
     return obj
 
 
@@ -68,42 +101,117 @@ class _ProtobufToJsonAdapter(requests.adapters.HTTPAdapter):
     ``Content-Type: application/x-protobuf``. Parseable only accepts JSON,
     so this adapter deserializes the protobuf and re-serializes to OTLP JSON
     with proper hex-encoded trace/span IDs.
+
+    A single adapter serves several signals; the protobuf message class for
+    each endpoint is registered with :meth:`register`.
+
+    When ``compress`` is set, JSON bodies larger than ``_GZIP_MIN_SIZE`` are
+    gzip-compressed at level 1, which is cheap and shrinks the repetitive
+    OTLP field names considerably.
     """
 
-    def __init__(self, proto_class, **kwargs):
-        self._proto_class = proto_class
+    def __init__(self, compress: bool = False, **kwargs):
+        # Protobuf message classes keyed by endpoint URL path
+        self._proto_classes: Dict[str, type] = {}
+        self._compress = compress
+        # Reusable message instances, per thread since send() runs
+        # concurrently from each signal's export thread
+        self._local = threading.local()
         super().__init__(**kwargs)
 
+    def register(self, endpoint: str, proto_class: type) -> None:
+        """Decode protobuf bodies POSTed to ``endpoint`` as ``proto_class``."""
+        self._proto_classes[urlsplit(endpoint).path] = proto_class
+
+    def _message(self, proto_class: type) -> Any:
+        """Return this thread's reusable instance of ``proto_class``."""
+        messages = getattr(self._local, "messages", None)
+        if messages is None:
+            messages = self._local.messages = {}
+        msg = messages.get(proto_class)
+        if msg is None:
+            msg = messages[proto_class] = proto_class()
+        return msg
+
     def send(self, request, *args, **kwargs):
         if (
             request.body
             and request.headers.get("Content-Type") == "application/x-protobuf"
         ):
-            msg = self._proto_class()
-            msg.ParseFromString(
-                request.body if isinstance(request.body, bytes)
-                else request.body.encode()
-            )
-            d = MessageToDict(msg, use_integers_for_enums=True)
-            d = _fix_bytes_fields(d)
-            body = json.dumps(d, ensure_ascii=False).encode("utf-8")
+            from google.protobuf.json_format import MessageToDict
+
+            proto_class = self._proto_classes.get(urlsplit(request.url).path)
+            if proto_class is None:
+                raise ValueError(
+                    f"No protobuf message class registered for {request.url}"
+                )
+            msg = self._message(proto_class)
+            try:
+                msg.ParseFromString(
+                    request.body if isinstance(request.body, bytes)
+                    else request.body.encode()
+                )
+                d = MessageToDict(msg, use_integers_for_enums=True)
+            finally:
+                # Release the batch's sub-messages until the next export
+                msg.Clear()
+            _fix_bytes_fields(d)
+            body = orjson.dumps(d)
+            if self._compress and len(body) > _GZIP_MIN_SIZE:
+                body = gzip.compress(body, compresslevel=1)
+                request.headers["Content-Encoding"] = "gzip"
             request.body = body
             request.headers["Content-Type"] = "application/json"
             request.headers["Content-Length"] = str(len(body))
         return super().send(request, *args, **kwargs)
 
 
-def _create_json_session(proto_class, endpoint: str) -> requests.Session:
-    """Create a requests Session that converts protobuf to JSON."""
+# Shared adapters keyed by (Parseable URL, gzip enabled)
+_adapters: Dict[Tuple[str, bool], _ProtobufToJsonAdapter] = {}
+
+
+def _get_adapter(config: ParseableConfig) -> _ProtobufToJsonAdapter:
+    """Return the adapter shared by all signals exporting to ``config.url``."""
+    key = (config.url, config.enable_gzip)
+    adapter = _adapters.get(key)
+    if adapter is None:
+        adapter = _adapters[key] = _ProtobufToJsonAdapter(
+            compress=config.enable_gzip,
+            pool_connections=_POOL_SIZE,
+            pool_maxsize=_POOL_SIZE,
+            pool_block=False,
+            max_retries=_CONNECT_RETRY,
+        )
+    return adapter
+
+
+def _create_json_session(
+    config: ParseableConfig, proto_class: type, endpoint: str
+) -> requests.Session:
+    """Create a requests Session that converts protobuf to JSON.
+
+    Each exporter needs its own Session because it sets its signal's
+    ``X-P-Stream`` headers on the session, but all sessions for the same
+    Parseable server mount the same adapter and so share its connections.
+    """
+    adapter = _get_adapter(config)
+    adapter.register(endpoint, proto_class)
     session = requests.Session()
-    session.mount(endpoint, _ProtobufToJsonAdapter(proto_class))
+    session.mount(endpoint, adapter)
     return session
 
 
 def create_trace_exporter(config: ParseableConfig) -> OTLPSpanExporter:
     """Create an OTLP HTTP span exporter targeting the Parseable traces stream."""
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+        OTLPSpanExporter,
+    )
+    from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
+        ExportTraceServiceRequest,
+    )
+
     session = _create_json_session(
-        ExportTraceServiceRequest, config.traces_endpoint
+        config, ExportTraceServiceRequest, config.traces_endpoint
     )
     return OTLPSpanExporter(
         endpoint=config.traces_endpoint,
@@ -114,8 +222,15 @@ def create_trace_exporter(config: ParseableConfig) -> OTLPSpanExporter:
 
 def create_log_exporter(config: ParseableConfig) -> OTLPLogExporter:
     """Create an OTLP HTTP log exporter targeting the Parseable logs stream."""
+    from opentelemetry.exporter.otlp.proto.http._log_exporter import (
+        OTLPLogExporter,
+    )
+    from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import (
+        ExportLogsServiceRequest,
+    )
+
     session = _create_json_session(
-        ExportLogsServiceRequest, config.logs_endpoint
+        config, ExportLogsServiceRequest, config.logs_endpoint
     )
     return OTLPLogExporter(
         endpoint=config.logs_endpoint,
@@ -126,8 +241,15 @@ def create_log_exporter(config: ParseableConfig) -> OTLPLogExporter:
 
 def create_metric_exporter(config: ParseableConfig) -> OTLPMetricExporter:
     """Create an OTLP HTTP metric exporter targeting the Parseable metrics stream."""
+    from opentelemetry.exporter.otlp.proto.http.metric_exporter import (
+        OTLPMetricExporter,
+    )
+    from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import (
+        ExportMetricsServiceRequest,
+    )
+
     session = _create_json_session(
-        ExportMetricsServiceRequest, config.metrics_endpoint
+        config, ExportMetricsServiceRequest, config.metrics_endpoint
     )
     return OTLPMetricExporter(
         endpoint=config.metrics_endpoint,
@@ -22,70 +22,88 @@ Workflow execution data is captured via traces instead.
 from __future__ import annotations
 
 import time
-from typing import Any
+from typing import Any, Dict, Tuple
 
 import temporalio.activity
-from opentelemetry.metrics import Meter
+from opentelemetry.metrics import Counter, Histogram, Meter
 from temporalio.worker import (
     ActivityInboundInterceptor,
     ExecuteActivityInput,
     Interceptor,
 )
 
-# Module-level meter reference, set by the plugin at init time
-_meter: Meter | None = None
+# Module-level instruments, created once by set_meter() at plugin init time
+# rather than per activity execution. ``_started`` being None means no meter
+# has been set and the interceptor passes activities straight through.
+_started: Counter | None = None
+_completed: Counter | None = None
+_failed: Counter | None = None
+_duration: Histogram | None = None
+
+# Metric attribute dicts keyed by (activity_type, workflow_type, task_queue,
+# namespace). Identical activity calls share one dict object, so the cached
+# dicts must never be mutated. They stay plain dicts rather than tuples of
+# pairs: the OTel SDK requires a Mapping and calls ``.items()`` on it to build
+# its aggregation key.
+_attrs_cache: Dict[Tuple[str, str, str, str], Dict[str, str]] = {}
 
 
 def set_meter(meter: Meter) -> None:
-    """Set the global meter used by the metrics interceptor."""
-    global _meter
-    _meter = meter
+    """Create the instruments used by the interceptor from ``meter``."""
+    global _started, _completed, _failed, _duration
+    _started = meter.create_counter(
+        "temporal.activity.started",
+        description="Activities started",
+    )
+    _completed = meter.create_counter(
+        "temporal.activity.completed",
+        description="Activities completed successfully",
+    )
+    _failed = meter.create_counter(
+        "temporal.activity.failed",
+        description="Activities that raised an exception",
+    )
+    _duration = meter.create_histogram(
+        "temporal.activity.duration",
+        unit="s",
+        description="Activity execution duration in seconds",
+    )
 
 
 class _MetricsActivityInterceptor(ActivityInboundInterceptor):
     """Records counters and duration histograms for activity executions."""
 
     async def execute_activity(self, input: ExecuteActivityInput) -> Any:
-        if _meter is None:
+        if _started is None:
             return await self.next.execute_activity(input)
 
         info = temporalio.activity.info()
-        attrs = {
-            "activity_type": info.activity_type,
-            "workflow_type": info.workflow_type,
-            "task_queue": info.task_queue,
-            "namespace": info.workflow_namespace,
-        }
-
-        started = _meter.create_counter(
-            "temporal.activity.started",
-            description="Activities started",
-        )
-        completed = _meter.create_counter(
-            "temporal.activity.completed",
-            description="Activities completed successfully",
-        )
-        failed = _meter.create_counter(
-            "temporal.activity.failed",
-            description="Activities that raised an exception",
+        key = (
+            info.activity_type,
+            info.workflow_type,
+            info.task_queue,
+            info.workflow_namespace,
         )
-        duration = _meter.create_histogram(
-            "temporal.activity.duration",
-            unit="s",
-            description="Activity execution duration in seconds",
-        )
-
-        started.add(1, attrs)
-        t0 = time.monotonic()
+        attrs = _attrs_cache.get(key)
+        if attrs is None:
+            attrs = _attrs_cache[key] = {
+                "activity_type": key[0],
+                "workflow_type": key[1],
+                "task_queue": key[2],
+                "namespace": key[3],
+            }
+
+        _started.add(1, attrs)
+        t0 = time.perf_counter_ns()
         try:
             result = await self.next.execute_activity(input)
-            completed.add(1, attrs)
+            _completed.add(1, attrs)
             return result
         except Exception:
-            failed.add(1, attrs)
+            _failed.add(1, attrs)
             raise
         finally:
-            duration.record(time.monotonic() - t0, attrs)
+            _duration.record((time.perf_counter_ns() - t0) * 1e-9, attrs)
 
 
 class MetricsInterceptor(Interceptor):
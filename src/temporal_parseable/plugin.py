@@ -6,18 +6,10 @@ import logging
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
-from temporalio.contrib.opentelemetry import TracingInterceptor
 from temporalio.plugin import SimplePlugin
 from temporalio.runtime import OpenTelemetryConfig, Runtime, TelemetryConfig
 
 from .config import ParseableConfig
-from .logging_handler import create_otel_logging_handler
-from .metrics_interceptor import MetricsInterceptor, set_meter
-from .otel_setup import (
-    setup_logger_provider,
-    setup_meter_provider,
-    setup_tracer_provider,
-)
 
 logger = logging.getLogger(__name__)
 
@@ -47,20 +39,31 @@ class ParseablePlugin(SimplePlugin):
 
     def __init__(self, config: ParseableConfig | None = None) -> None:
         self.config = config or ParseableConfig()
-        self._providers: list = []
+        providers: list = []
+
+        # The OTel SDK, OTLP exporters and their protobuf modules are only
+        # imported for enabled signals; with every signal disabled the plugin
+        # loads none of them.
 
         # --- Tracing ---
         tracing_interceptor = None
         if self.config.enable_traces:
+            from temporalio.contrib.opentelemetry import TracingInterceptor
+
+            from .otel_setup import setup_tracer_provider
+
             tracer_provider = setup_tracer_provider(self.config)
-            self._providers.append(tracer_provider)
+            providers.append(tracer_provider)
             tracing_interceptor = TracingInterceptor()
             logger.info("Traces enabled → %s", self.config.traces_stream)
 
         # --- Logging ---
         if self.config.enable_logs:
+            from .logging_handler import create_otel_logging_handler
+            from .otel_setup import setup_logger_provider
+
             logger_provider = setup_logger_provider(self.config)
-            self._providers.append(logger_provider)
+            providers.append(logger_provider)
             handler = create_otel_logging_handler(logger_provider)
             handler.setLevel(logging.DEBUG)
             logging.getLogger().addHandler(handler)
@@ -69,13 +72,18 @@ class ParseablePlugin(SimplePlugin):
         # --- Metrics ---
         metrics_interceptor = None
         if self.config.enable_metrics:
+            from .metrics_interceptor import MetricsInterceptor, set_meter
+            from .otel_setup import setup_meter_provider
+
             meter_provider = setup_meter_provider(self.config)
-            self._providers.append(meter_provider)
+            providers.append(meter_provider)
             meter = meter_provider.get_meter("temporal-parseable")
             set_meter(meter)
             metrics_interceptor = MetricsInterceptor()
             logger.info("Metrics enabled → %s", self.config.metrics_stream)
 
+        self._providers = tuple(providers)
+
         # Build interceptor lists for SimplePlugin
         client_interceptors = [tracing_interceptor] if tracing_interceptor else []
         worker_interceptors = [metrics_interceptor] if metrics_interceptor else []
@@ -101,8 +109,10 @@ class ParseablePlugin(SimplePlugin):
             telemetry=TelemetryConfig(
                 metrics=OpenTelemetryConfig(
                     url=self.config.metrics_endpoint,
-                    headers=self.config.headers_for_signal(
-                        self.config.metrics_stream, "metrics"
+                    headers=dict(
+                        self.config.headers_for_signal(
+                            self.config.metrics_stream, "metrics"
+                        )
                     ),
                     http=True,
                 ),
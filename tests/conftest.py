@@ -7,22 +7,31 @@ import pytest
 from temporal_parseable.config import ParseableConfig
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_config() -> ParseableConfig:
-    """Return a ParseableConfig with all defaults."""
+    """Return a ParseableConfig with all defaults.
+
+    Configs are frozen, so one instance per session can be shared safely.
+    """
     return ParseableConfig()
 
 
-@pytest.fixture
-def custom_config(monkeypatch: pytest.MonkeyPatch) -> ParseableConfig:
-    """Return a ParseableConfig driven by environment variables."""
-    monkeypatch.setenv("PARSEABLE_URL", "http://parseable.example.com:9000")
-    monkeypatch.setenv("PARSEABLE_USERNAME", "testuser")
-    monkeypatch.setenv("PARSEABLE_PASSWORD", "testpass")
-    monkeypatch.setenv("PARSEABLE_TRACES_STREAM", "my-traces")
-    monkeypatch.setenv("PARSEABLE_LOGS_STREAM", "my-logs")
-    monkeypatch.setenv("PARSEABLE_METRICS_STREAM", "my-metrics")
-    monkeypatch.setenv("PARSEABLE_TEMPORAL_HOST", "temporal.example.com:7233")
-    monkeypatch.setenv("PARSEABLE_SERVICE_NAME", "my-service")
-    monkeypatch.setenv("PARSEABLE_ENABLE_METRICS", "false")
-    return ParseableConfig()
+@pytest.fixture(scope="session")
+def custom_config() -> ParseableConfig:
+    """Return a ParseableConfig driven by environment variables.
+
+    Shared for the session like ``default_config``. The variables are only
+    set while the config is constructed, so they do not leak into other
+    tests.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("PARSEABLE_URL", "http://parseable.example.com:9000")
+        mp.setenv("PARSEABLE_USERNAME", "testuser")
+        mp.setenv("PARSEABLE_PASSWORD", "testpass")
+        mp.setenv("PARSEABLE_TRACES_STREAM", "my-traces")
+        mp.setenv("PARSEABLE_LOGS_STREAM", "my-logs")
+        mp.setenv("PARSEABLE_METRICS_STREAM", "my-metrics")
+        mp.setenv("PARSEABLE_TEMPORAL_HOST", "temporal.example.com:7233")
+        mp.setenv("PARSEABLE_SERVICE_NAME", "my-service")
+        mp.setenv("PARSEABLE_ENABLE_METRICS", "false")
+        return ParseableConfig()
@@ -3,6 +3,11 @@
 from __future__ import annotations
 
 import base64
+import copy
+import pickle
+
+import pytest
+from pydantic import ValidationError
 
 from temporal_parseable.config import ParseableConfig
 
@@ -26,11 +31,18 @@ class TestDefaults:
     def test_default_service_name(self, default_config: ParseableConfig) -> None:
         assert default_config.service_name == "temporal-worker"
 
+    def test_frozen(self, default_config: ParseableConfig) -> None:
+        with pytest.raises(ValidationError):
+            default_config.url = "http://other:8000"  # type: ignore[misc]
+
     def test_all_signals_enabled(self, default_config: ParseableConfig) -> None:
         assert default_config.enable_traces is True
         assert default_config.enable_logs is True
         assert default_config.enable_metrics is True
 
+    def test_gzip_enabled(self, default_config: ParseableConfig) -> None:
+        assert default_config.enable_gzip is True
+
 
 class TestEnvOverrides:
     def test_url_override(self, custom_config: ParseableConfig) -> None:
@@ -72,6 +84,9 @@ class TestAuthHeader:
         decoded = base64.b64decode(encoded).decode()
         assert decoded == "testuser:testpass"
 
+    def test_auth_header_cached(self, default_config: ParseableConfig) -> None:
+        assert default_config.auth_header is default_config.auth_header
+
 
 class TestHeadersForSignal:
     def test_contains_required_keys(self, default_config: ParseableConfig) -> None:
@@ -96,6 +111,46 @@ class TestHeadersForSignal:
         headers = default_config.headers_for_signal("s", "metrics")
         assert headers["X-P-Log-Source"] == "otel-metrics"
 
+    def test_unknown_signal_rejected(
+        self, default_config: ParseableConfig
+    ) -> None:
+        with pytest.raises(ValueError, match="Unknown signal"):
+            default_config.headers_for_signal("s", "profiles")
+
+    def test_configured_stream_headers_precomputed(
+        self, default_config: ParseableConfig
+    ) -> None:
+        stream = default_config.traces_stream
+        headers = default_config.headers_for_signal(stream, "traces")
+        assert default_config._headers["traces"] == headers
+
+    def test_other_streams_not_cached(
+        self, default_config: ParseableConfig
+    ) -> None:
+        default_config.headers_for_signal("s", "traces")
+        assert default_config._headers["traces"]["X-P-Stream"] != "s"
+
+    def test_headers_read_only(self, default_config: ParseableConfig) -> None:
+        headers = default_config.headers_for_signal("s", "traces")
+        with pytest.raises(TypeError):
+            headers["X-P-Stream"] = "other"  # type: ignore[index]
+
+
+class TestSerialization:
+    def test_pickle_round_trip(self, custom_config: ParseableConfig) -> None:
+        restored = pickle.loads(pickle.dumps(custom_config))
+        assert restored.model_dump() == custom_config.model_dump()
+        assert restored.headers_for_signal(
+            restored.traces_stream, "traces"
+        ) == custom_config.headers_for_signal(custom_config.traces_stream, "traces")
+
+    def test_deepcopy_round_trip(self, custom_config: ParseableConfig) -> None:
+        copied = copy.deepcopy(custom_config)
+        assert copied.model_dump() == custom_config.model_dump()
+        assert copied.headers_for_signal(
+            copied.logs_stream, "logs"
+        ) == custom_config.headers_for_signal(custom_config.logs_stream, "logs")
+
 
 class TestEndpoints:
     def test_traces_endpoint(self, default_config: ParseableConfig) -> None:
@@ -111,3 +166,53 @@ class TestEndpoints:
         assert custom_config.traces_endpoint == (
             "http://parseable.example.com:9000/v1/traces"
         )
+
+
+class TestModelCopy:
+    def test_update_recomputes_derived_values(
+        self, default_config: ParseableConfig
+    ) -> None:
+        # Touch every cached value so the copy starts from a populated cache
+        default_config.auth_header
+        default_config.traces_endpoint
+        copied = default_config.model_copy(
+            update={"url": "http://new:1", "password": "secret"}
+        )
+        assert copied.traces_endpoint == "http://new:1/v1/traces"
+        assert copied.metrics_endpoint == "http://new:1/v1/metrics"
+        decoded = base64.b64decode(
+            copied.auth_header.removeprefix("Basic ")
+        ).decode()
+        assert decoded == "admin:secret"
+        headers = copied.headers_for_signal(copied.traces_stream, "traces")
+        assert headers["Authorization"] == copied.auth_header
+
+    def test_update_stream_recomputes_headers(
+        self, default_config: ParseableConfig
+    ) -> None:
+        copied = default_config.model_copy(update={"traces_stream": "other"})
+        headers = copied.headers_for_signal("other", "traces")
+        assert headers["X-P-Stream"] == "other"
+        assert copied._headers["traces"] == headers
+
+    def test_deep_copy(self, default_config: ParseableConfig) -> None:
+        copied = default_config.model_copy(deep=True)
+        assert copied.model_dump() == default_config.model_dump()
+        assert copied.traces_endpoint == default_config.traces_endpoint
+        assert copied.headers_for_signal(
+            copied.traces_stream, "traces"
+        ) == default_config.headers_for_signal(
+            default_config.traces_stream, "traces"
+        )
+
+    def test_deep_copy_with_update(self, default_config: ParseableConfig) -> None:
+        copied = default_config.model_copy(
+            update={"url": "http://new:1", "logs_stream": "other"}, deep=True
+        )
+        assert copied.logs_endpoint == "http://new:1/v1/logs"
+        headers = copied.headers_for_signal("other", "logs")
+        assert copied._headers["logs"] == headers
+
+    def test_original_unchanged(self, default_config: ParseableConfig) -> None:
+        default_config.model_copy(update={"url": "http://new:1"})
+        assert default_config.traces_endpoint == "http://localhost:8000/v1/traces"
@@ -2,17 +2,15 @@
 
 from __future__ import annotations
 
+import copy
+import pickle
+
 import pytest
+import pytest_asyncio
 from temporalio.testing import WorkflowEnvironment
 from temporalio.worker import Worker
 
-import sys
-import os
-
-# Add demo directory to path so we can import workflows
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "demo"))
-
-from workflows import (  # noqa: E402
+from demo.workflows import (
     GreetingWorkflow,
     OrderItem,
     OrderWorkflow,
@@ -23,14 +21,19 @@ from workflows import (  # noqa: E402
 
 TASK_QUEUE = "test-queue"
 
+# The time-skipping test server and worker are started once for the whole
+# module, so every workflow test must run on the same event loop and use a
+# unique workflow id.
+module_loop = pytest.mark.asyncio(loop_scope="module")
+
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def env():
     async with await WorkflowEnvironment.start_time_skipping() as env:
         yield env
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def worker(env: WorkflowEnvironment):
     async with Worker(
         env.client,
@@ -41,6 +44,7 @@ async def worker(env: WorkflowEnvironment):
         yield w
 
 
+@module_loop
 class TestGreetingWorkflow:
     async def test_greeting(self, env: WorkflowEnvironment, worker: Worker) -> None:
         result = await env.client.execute_workflow(
@@ -52,6 +56,7 @@ class TestGreetingWorkflow:
         assert result == "Hello, World!"
 
 
+@module_loop
 class TestOrderWorkflow:
     async def test_valid_order(self, env: WorkflowEnvironment, worker: Worker) -> None:
         item = OrderItem(product="Widget", quantity=3, price=9.99)
@@ -74,3 +79,11 @@ class TestOrderWorkflow:
             task_queue=TASK_QUEUE,
         )
         assert result == "ORDER_INVALID"
+
+
+class TestOrderItem:
+    def test_copy_and_pickle_round_trip(self) -> None:
+        item = OrderItem(product="Widget", quantity=3, price=9.99)
+        assert copy.copy(item) == item
+        assert copy.deepcopy(item) == item
+        assert pickle.loads(pickle.dumps(item)) == item
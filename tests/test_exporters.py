@@ -2,17 +2,91 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
+import gzip
+import json
+
+import pytest
+import requests
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
 from opentelemetry.exporter.otlp.proto.http._log_exporter import OTLPLogExporter
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import (
+    ExportLogsServiceRequest,
+)
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
+    ExportTraceServiceRequest,
+)
 
 from temporal_parseable.config import ParseableConfig
 from temporal_parseable.exporters import (
+    _GZIP_MIN_SIZE,
+    _ProtobufToJsonAdapter,
+    _b64_to_hex,
+    _create_json_session,
+    _fix_bytes_fields,
+    _get_adapter,
     create_log_exporter,
     create_metric_exporter,
     create_trace_exporter,
 )
 
+TRACES_ENDPOINT = "http://parseable.test/v1/traces"
+TRACE_ID = bytes(range(16))
+SPAN_ID = bytes(range(8))
+
+
+def _trace_request(*names: str) -> ExportTraceServiceRequest:
+    """Build a trace export request with one span per name."""
+    msg = ExportTraceServiceRequest()
+    scope = msg.resource_spans.add().scope_spans.add()
+    for name in names:
+        span = scope.spans.add()
+        span.trace_id = TRACE_ID
+        span.span_id = SPAN_ID
+        span.name = name
+    return msg
+
+
+def _send(
+    adapter: _ProtobufToJsonAdapter,
+    msg: ExportTraceServiceRequest,
+    url: str = TRACES_ENDPOINT,
+) -> requests.PreparedRequest:
+    """POST ``msg`` through ``adapter`` and return the request it forwards."""
+    request = requests.Request(
+        "POST",
+        url,
+        data=msg.SerializeToString(),
+        headers={"Content-Type": "application/x-protobuf"},
+    ).prepare()
+    return adapter.send(request)
+
+
+def _decode(request: requests.PreparedRequest) -> dict:
+    body = request.body
+    if request.headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    return json.loads(body)
+
+
+@pytest.fixture
+def no_network(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make HTTPAdapter.send return the prepared request instead of sending."""
+    monkeypatch.setattr(
+        requests.adapters.HTTPAdapter,
+        "send",
+        lambda self, request, *args, **kwargs: request,
+    )
+
+
+@pytest.fixture
+def adapter() -> _ProtobufToJsonAdapter:
+    adapter = _ProtobufToJsonAdapter(compress=True)
+    adapter.register(TRACES_ENDPOINT, ExportTraceServiceRequest)
+    return adapter
+
 
 class TestTraceExporter:
     def test_returns_otlp_span_exporter(self, default_config: ParseableConfig) -> None:
@@ -53,3 +127,101 @@ class TestMetricExporter:
         )
         assert headers["X-P-Stream"] == "temporal-metrics"
         assert headers["X-P-Log-Source"] == "otel-metrics"
+
+
+class TestB64ToHex:
+    def test_trace_and_span_ids(self) -> None:
+        for raw in (bytes(range(16)), bytes(range(8))):
+            assert _b64_to_hex(base64.b64encode(raw).decode()) == raw.hex()
+
+    def test_malformed_input_raises(self) -> None:
+        with pytest.raises(binascii.Error):
+            _b64_to_hex("AAECAw=")
+
+
+class TestFixBytesFields:
+    def test_converts_nested_ids(self) -> None:
+        span = {"traceId": "AAECAw==", "spanId": "BAUGBw==", "name": "s"}
+        d = {"resourceSpans": [{"scopeSpans": [{"spans": [span]}]}]}
+        _fix_bytes_fields(d)
+        assert span["traceId"] == "00010203"
+        assert span["spanId"] == "04050607"
+        assert span["name"] == "s"
+
+    def test_leaves_other_keys_untouched(self) -> None:
+        d = {"attributes": [{"key": "spanId", "value": {"stringValue": "x"}}]}
+        assert _fix_bytes_fields(d) == {
+            "attributes": [{"key": "spanId", "value": {"stringValue": "x"}}]
+        }
+
+
+class TestSharedAdapter:
+    def test_adapter_cached_per_config(
+        self, default_config: ParseableConfig
+    ) -> None:
+        assert _get_adapter(default_config) is _get_adapter(default_config)
+
+    def test_signals_share_adapter(self, default_config: ParseableConfig) -> None:
+        traces = _create_json_session(
+            default_config, ExportTraceServiceRequest, default_config.traces_endpoint
+        )
+        logs = _create_json_session(
+            default_config, ExportLogsServiceRequest, default_config.logs_endpoint
+        )
+        assert traces is not logs
+        assert traces.get_adapter(
+            default_config.traces_endpoint
+        ) is logs.get_adapter(default_config.logs_endpoint)
+
+
+@pytest.mark.usefixtures("no_network")
+class TestJsonAdapter:
+    def test_large_body_gzipped(self, adapter: _ProtobufToJsonAdapter) -> None:
+        sent = _send(adapter, _trace_request("x" * (2 * _GZIP_MIN_SIZE)))
+        assert sent.headers["Content-Encoding"] == "gzip"
+        assert sent.headers["Content-Type"] == "application/json"
+        assert sent.headers["Content-Length"] == str(len(sent.body))
+        assert len(gzip.decompress(sent.body)) > _GZIP_MIN_SIZE
+
+    def test_small_body_uncompressed(
+        self, adapter: _ProtobufToJsonAdapter
+    ) -> None:
+        sent = _send(adapter, _trace_request("s"))
+        assert "Content-Encoding" not in sent.headers
+        assert sent.headers["Content-Type"] == "application/json"
+        assert sent.headers["Content-Length"] == str(len(sent.body))
+
+    def test_compression_disabled(self) -> None:
+        adapter = _ProtobufToJsonAdapter(compress=False)
+        adapter.register(TRACES_ENDPOINT, ExportTraceServiceRequest)
+        sent = _send(adapter, _trace_request("x" * (2 * _GZIP_MIN_SIZE)))
+        assert "Content-Encoding" not in sent.headers
+        assert sent.headers["Content-Length"] == str(len(sent.body))
+
+    def test_json_has_hex_ids(self, adapter: _ProtobufToJsonAdapter) -> None:
+        for name in ("s", "x" * (2 * _GZIP_MIN_SIZE)):
+            d = _decode(_send(adapter, _trace_request(name)))
+            span = d["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+            assert span["traceId"] == TRACE_ID.hex()
+            assert span["spanId"] == SPAN_ID.hex()
+            assert span["name"] == name
+
+    def test_unregistered_endpoint_raises(
+        self, adapter: _ProtobufToJsonAdapter
+    ) -> None:
+        with pytest.raises(ValueError, match="No protobuf message class"):
+            _send(adapter, _trace_request("s"), url="http://parseable.test/v1/x")
+
+    def test_reused_message_not_leaked_between_sends(
+        self, adapter: _ProtobufToJsonAdapter
+    ) -> None:
+        first = _trace_request("first-a", "first-b")
+        attr = first.resource_spans[0].resource.attributes.add(key="k")
+        attr.value.string_value = "v"
+        _send(adapter, first)
+        d = _decode(_send(adapter, _trace_request("second")))
+        assert len(d["resourceSpans"]) == 1
+        assert "resource" not in d["resourceSpans"][0]
+        spans = d["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        assert [span["name"] for span in spans] == ["second"]
+        assert adapter._message(ExportTraceServiceRequest).ByteSize() == 0
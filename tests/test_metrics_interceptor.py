@@ -0,0 +1,140 @@
+"""Tests for the activity metrics interceptor."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+import temporalio.activity
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from temporal_parseable import metrics_interceptor
+from temporal_parseable.metrics_interceptor import (
+    _MetricsActivityInterceptor,
+    set_meter,
+)
+
+INFO = SimpleNamespace(
+    activity_type="greet",
+    workflow_type="GreetingWorkflow",
+    task_queue="test-queue",
+    workflow_namespace="default",
+)
+ATTRS = {
+    "activity_type": "greet",
+    "workflow_type": "GreetingWorkflow",
+    "task_queue": "test-queue",
+    "namespace": "default",
+}
+
+
+class _Next:
+    """Stand-in for the next interceptor in the chain."""
+
+    def __init__(self, result: Any = None, error: Exception | None = None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+
+    async def execute_activity(self, input: Any) -> Any:
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class _RecordingCounter:
+    def __init__(self) -> None:
+        self.attributes: List[Dict[str, str]] = []
+
+    def add(self, amount: int, attributes: Dict[str, str]) -> None:
+        self.attributes.append(attributes)
+
+
+@pytest.fixture
+def isolated(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Restore the interceptor's module state and fake the activity info."""
+    for name in ("_started", "_completed", "_failed", "_duration"):
+        monkeypatch.setattr(metrics_interceptor, name, None)
+    monkeypatch.setattr(metrics_interceptor, "_attrs_cache", {})
+    monkeypatch.setattr(temporalio.activity, "info", lambda: INFO)
+
+
+@pytest.fixture
+def reader(isolated: None) -> InMemoryMetricReader:
+    """Install instruments backed by an in-memory metric reader."""
+    reader = InMemoryMetricReader()
+    provider = MeterProvider(metric_readers=[reader])
+    set_meter(provider.get_meter("test"))
+    return reader
+
+
+def _points(reader: InMemoryMetricReader) -> Dict[str, list]:
+    """Return the recorded data points keyed by metric name."""
+    data = reader.get_metrics_data()
+    return {
+        metric.name: list(metric.data.data_points)
+        for rm in data.resource_metrics
+        for sm in rm.scope_metrics
+        for metric in sm.metrics
+    }
+
+
+class TestMetricsActivityInterceptor:
+    async def test_success(self, reader: InMemoryMetricReader) -> None:
+        interceptor = _MetricsActivityInterceptor(_Next(result="ok"))
+        assert await interceptor.execute_activity(None) == "ok"
+
+        points = _points(reader)
+        assert "temporal.activity.failed" not in points
+        for name in ("temporal.activity.started", "temporal.activity.completed"):
+            (point,) = points[name]
+            assert point.value == 1
+            assert dict(point.attributes) == ATTRS
+        (duration,) = points["temporal.activity.duration"]
+        assert duration.count == 1
+        assert duration.sum >= 0
+        assert dict(duration.attributes) == ATTRS
+
+    async def test_failure(self, reader: InMemoryMetricReader) -> None:
+        interceptor = _MetricsActivityInterceptor(_Next(error=ValueError("boom")))
+        with pytest.raises(ValueError, match="boom"):
+            await interceptor.execute_activity(None)
+
+        points = _points(reader)
+        assert "temporal.activity.completed" not in points
+        for name in ("temporal.activity.started", "temporal.activity.failed"):
+            (point,) = points[name]
+            assert point.value == 1
+            assert dict(point.attributes) == ATTRS
+        (duration,) = points["temporal.activity.duration"]
+        assert duration.count == 1
+
+    async def test_attrs_dict_reused(
+        self, reader: InMemoryMetricReader, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        started = _RecordingCounter()
+        monkeypatch.setattr(metrics_interceptor, "_started", started)
+        interceptor = _MetricsActivityInterceptor(_Next())
+        await interceptor.execute_activity(None)
+        await interceptor.execute_activity(None)
+
+        first, second = started.attributes
+        assert first is second
+        assert first == ATTRS
+        assert list(metrics_interceptor._attrs_cache.values()) == [first]
+
+    async def test_passthrough_without_meter(
+        self, isolated: None, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def no_info() -> None:
+            raise AssertionError("activity.info() should not be called")
+
+        monkeypatch.setattr(temporalio.activity, "info", no_info)
+        next_interceptor = _Next(result="ok")
+        interceptor = _MetricsActivityInterceptor(next_interceptor)
+        assert await interceptor.execute_activity(None) == "ok"
+        assert next_interceptor.calls == 1
+        assert metrics_interceptor._attrs_cache == {}